@@ -1,7 +1,23 @@
-import random
+import re
+import sys
 
-from itertools import product
-from typing import List, Tuple
+import numpy as np
+
+from scipy import ndimage
+
+# Geometry of the board drawn by _visualize.
+_CELL_WIDTH = 5
+_LEFT_MARGIN = 3
+
+# Cell contents preformatted at full width (_CELL_WIDTH - 1) for the
+# row builder in _visualize, indexed by cell state + 1.
+_CELL = tuple(
+    (" " + c).ljust(_CELL_WIDTH - 1)
+    for c in ("", "0", "1", "2", "3", "4", "5", "6", "7", "8", "M"))
+
+# A pair of non-negative integers separated by whitespace, the shape
+# of every line the game reads.
+_INPUT_RE = re.compile(r"^\s*(\d+)\s+(\d+)\s*$")
 
 
 class MineSweeper:
@@ -17,6 +33,18 @@ class MineSweeper:
     cells that are known to have no mines.
 
     """
+
+    # Fixed slots instead of a per-instance __dict__: attribute reads
+    # outside the hoisted loops become fixed-offset loads.
+    __slots__ = (
+        '_board_size', '_number_of_mines', '_seen_cells',
+        '_cells_to_win',
+        '_has_stepped_on_mine', '_mines_bits', '_counts',
+        '_region_labels', '_region_masks',
+        '_vis_state', '_game_over',
+        '_header_cells', '_row_labels',
+        '_sep_line', '_empty_line', '_under_line')
+
     def __init__(self, board_size: int = 10, number_of_mines: int = 10):
         """Initialization of minesweeper.
 
@@ -33,29 +61,102 @@ class MineSweeper:
         self._board_size = board_size  # Size of the square gameboard.
         self._number_of_mines = number_of_mines  # Number of mines.
         self._seen_cells = 0  # Number of cells users have sweeped.
+        # Number of sweeped cells at which the game is won.
+        self._cells_to_win = (
+            board_size * board_size - number_of_mines)
         self._has_stepped_on_mine = False
 
-        # Gameboard boolean that says whether a mine exists in a cell.
-        self._game_board: List[List[bool]] = [
-            [False for i in range(board_size)] for j in range(board_size)]
+        # Boolean mask that says whether a mine exists in a cell. It is
+        # only needed while building the derived boards below; the packed
+        # bitset is what the instance keeps.
+        mine_mask = np.zeros((board_size, board_size), dtype=np.bool_)
+
+        # Randomly sample flat indices to create m mines. Sampling the
+        # integer range directly avoids materializing the N*N candidate
+        # cells the way sampling (x, y) pairs would.
+        mines = np.random.default_rng().choice(
+            board_size * board_size,
+            size=self._number_of_mines, replace=False)
+        mine_mask.ravel()[mines] = True
+
+        # The mine board packed 64 cells to a uint64 word, so each row
+        # takes ceil(N / 64) words instead of N bytes. _sweep tests a
+        # cell with a shift and mask on the word holding it.
+        words_per_row = (board_size + 63) // 64
+        padded_mask = np.zeros(
+            (board_size, words_per_row * 64), dtype=np.bool_)
+        padded_mask[:, :board_size] = mine_mask
+        self._mines_bits = np.packbits(
+            padded_mask, axis=1, bitorder="little").view(np.uint64)
+
+        # Number of adjacent mines for every cell, computed once up
+        # front. Adding the mine mask into the 8 shifted windows of a
+        # zero-padded accumulator unrolls to 8 contiguous int8 adds
+        # that NumPy runs as straight SIMD loops, with no temporary per
+        # offset; the unpadded interior window is the counts grid.
+        n = board_size
+        padded_counts = np.zeros((n + 2, n + 2), dtype=np.int8)
+        mines_int8 = mine_mask.astype(np.int8)
+        padded_counts[0:n, 0:n] += mines_int8
+        padded_counts[0:n, 1:n + 1] += mines_int8
+        padded_counts[0:n, 2:n + 2] += mines_int8
+        padded_counts[1:n + 1, 0:n] += mines_int8
+        padded_counts[1:n + 1, 2:n + 2] += mines_int8
+        padded_counts[2:n + 2, 0:n] += mines_int8
+        padded_counts[2:n + 2, 1:n + 1] += mines_int8
+        padded_counts[2:n + 2, 2:n + 2] += mines_int8
+        counts = padded_counts[1:n + 1, 1:n + 1]
+        self._counts = counts
+
+        # Zero-count regions are labeled with 8-connectivity once here,
+        # and the reveal mask of each region (its zero cells plus the
+        # numbered one-cell border) is precomputed, so clicking any
+        # zero-count cell reveals the whole region with one masked
+        # store instead of a flood fill at click time. Mines never
+        # appear in a mask: a cell next to a mine has a positive count.
+        eight_connected = np.ones((3, 3), dtype=np.bool_)
+        self._region_labels, region_count = ndimage.label(
+            (counts == 0) & ~mine_mask, structure=eight_connected)
+        self._region_masks = [None]
+        for region in range(1, region_count + 1):
+            self._region_masks.append(ndimage.binary_dilation(
+                self._region_labels == region,
+                structure=eight_connected))
+
+        # Gameboard that player sees, one byte per cell.
+        # -1 means the user hasn't seen this cell;
+        # 0 to 8 means the number of mines around this cell;
+        # 9 means the user has sweeped a cell with mine.
+        # Formatting into display characters happens only in _visualize.
+        self._vis_state = np.full(
+            (board_size, board_size), -1, dtype=np.int8)
+        self._game_over = False
 
-        # Randomly sample indices to create m mines.
-        all_indices: List(Tuple(int, int)) = list(
-            product([i for i in range(board_size)], repeat = 2))
-        mines: List(Tuple(int, int)) = random.sample(
-            all_indices, self._number_of_mines)
+        # Index labels for _visualize, formatted once per instance
+        # instead of calling str(i) per header cell per frame.
+        labels = [str(i) for i in range(board_size)]
+        self._header_cells = [
+            " " * (_CELL_WIDTH - len(s)) + s for s in labels]
+        self._row_labels = [
+            s + " " * (_LEFT_MARGIN - len(s)) for s in labels]
+
+        # The separator lines of the drawing never change, so they are
+        # built once here and reused for every row of every frame.
+        margin = " " * _LEFT_MARGIN
+        self._sep_line = margin + "_" * (_CELL_WIDTH * board_size)
+        self._empty_line = (
+            margin + ("|" + " " * (_CELL_WIDTH - 1)) * board_size + "|")
+        self._under_line = (
+            margin + ("|" + "_" * (_CELL_WIDTH - 1)) * board_size + "|")
 
-        for (x, y) in mines:
-            self._game_board[x][y] = True
+        self._visualize()
 
-        # Gameboard that player sees. "" means the user hasn't seen this cell;
-        # Positive number means the number of mines around this cell;
-        # "M" means the user has sweeped a cell with mine.
-        self._visualization_board: List[List[str]] = [
-            ["" for i in range(board_size)] for j in range(board_size)]
-        self._game_over = False
 
-        self._visualize()
+    def _mine_mask(self) -> np.ndarray:
+        """Unpack the bit-packed mine board into a boolean (N, N) mask."""
+        return np.unpackbits(
+            self._mines_bits.view(np.uint8), axis=1,
+            count=self._board_size, bitorder="little").astype(np.bool_)
 
 
     def _sweep(self, x: int, y: int):
@@ -76,52 +177,34 @@ class MineSweeper:
             print("Invalid entries.")
             return
 
-        if not self._visualization_board[x][y] == "":
+        if not self._vis_state[x, y] == -1:
             print("Cell already visited.")
             return
 
-        # delta_x/y of adjacent cells.
-        delta_x = [-1, -1, -1, 0, 0, 1, 1, 1]
-        delta_y = [-1, 0, 1, -1, 1, -1, 0, 1]
-
-        cells_to_sweep = [(x, y)]
-        while cells_to_sweep:
-            x, y = cells_to_sweep.pop()
-            if self._game_board[x][y]:  # Check if it is a mine.
-                self._has_stepped_on_mine = True
-                # If stepped on a mine, show ALL mines' positions
-                for t in range(self._board_size):
-                    for q in range(self._board_size):
-                        if self._game_board[t][q]:
-                            self._visualization_board[t][q] = "M"
-                return
-            else:
-                # If this cell has already been sweeped, then continue.
-                if not self._visualization_board[x][y] == "":
-                    continue
-                self._seen_cells += 1
-                # Iterate through its neighbors and count number of mines.
-                count = 0
-                valid_neighbors: List[Tuple[int, int]] = []
-                for i in range(8):  # 8 possible neighbors in total
-                    new_x = x + delta_x[i]
-                    new_y = y + delta_y[i]
-                    if (new_x < 0 or new_x >= self._board_size
-                        or new_y < 0 or new_y >= self._board_size):
-                        continue
-                    valid_neighbors.append((new_x, new_y))
-                    count += self._game_board[new_x][new_y]
-                if not count == 0:
-                    self._visualization_board[x][y] = str(count)
-                else:
-                    # If there is no mine in the neighbor,
-                    # automatically click all neighbors.
-                    self._visualization_board[x][y] = "0"
-                    for neighbor in valid_neighbors:
-                        n_x = neighbor[0]
-                        n_y = neighbor[1]
-                        if self._visualization_board[n_x][n_y] == "":
-                            cells_to_sweep.append((n_x, n_y))
+        # Check if it is a mine. Only the clicked cell can be one: the
+        # region revealed by a zero-count click never contains a mine,
+        # because a cell next to a mine always has a positive count.
+        if (int(self._mines_bits[x, y >> 6]) >> (y & 63)) & 1:
+            self._has_stepped_on_mine = True
+            # If stepped on a mine, show ALL mines' positions.
+            # The unpacked mask doubles as a boolean index, so this
+            # is one vectorized store instead of a loop over the board.
+            self._vis_state[self._mine_mask()] = 9
+            return
+
+        if not self._counts[x, y] == 0:
+            # A numbered cell reveals only itself.
+            self._vis_state[x, y] = self._counts[x, y]
+            self._seen_cells += 1
+            return
+
+        # A zero-count click reveals its whole precomputed region in
+        # one masked store. Borders of nearby regions can overlap, so
+        # the newly revealed cells are counted at click time.
+        mask = self._region_masks[self._region_labels[x, y]]
+        newly = mask & (self._vis_state == -1)
+        self._vis_state[newly] = self._counts[newly]
+        self._seen_cells += int(np.count_nonzero(newly))
 
 
     def _visualize(self):
@@ -153,52 +236,48 @@ class MineSweeper:
                |____|____|____|____|____|
 
         """
-        cell_width = 5
-        left_margin = 3
-
-        print()
-        print(" " * int(cell_width * self._board_size / 2) + "MineSweeper")
-        print()
-
-        # Drawing the horizontal header.
-        horizontal_header = " " * left_margin
-        for i in range(self._board_size):
-            horizontal_header += " " * (cell_width - len(str(i))) + str(i)
-        print(horizontal_header)
-
-        for i in range(self._board_size):
-            st = " " * left_margin
+        cell_width = _CELL_WIDTH
+        left_margin = _LEFT_MARGIN
+
+        # Instance attributes used inside the row loop are bound to
+        # locals once, so the loop does LOAD_FAST instead of a dict
+        # lookup through self on every iteration.
+        board_size = self._board_size
+        vis_state = self._vis_state
+        row_labels = self._row_labels
+        empty_line = self._empty_line
+        under_line = self._under_line
+
+        # The whole frame is collected into one buffer and written with
+        # a single sys.stdout.write instead of one print per line.
+        lines = [""]
+        lines.append(
+            " " * int(cell_width * board_size / 2) + "MineSweeper")
+        lines.append("")
+
+        # Drawing the horizontal header. Each line is assembled with a
+        # single join/repeat instead of growing a string in a loop.
+        lines.append(" " * left_margin + "".join(self._header_cells))
+
+        for i in range(board_size):
             if i == 0:
-                for _ in range(self._board_size):
-                    st = st + "_" * cell_width
-                print(st)
+                lines.append(self._sep_line)
 
             # Drawing the first line of each row.
-            st = " " * left_margin
-            for _ in range(self._board_size):
-                 st = st + "|" + " " * (cell_width - 1)
-            print(st + "|")
+            lines.append(empty_line)
 
             # Drawing the second line of each row,
-            # it also contains the vertical header.
-            st = str(i) + " " * (left_margin - len(str(i)))
-            for j in range(self._board_size):
-                # If visualization_board[i][j] is a number or "M",
-                # we can draw 1 less space.
-                # But if it is "", we still need to draw the space.
-                remaining_space = (
-                    cell_width - 2 - len(self._visualization_board[i][j]))
-                st += (
-                    "|" + " " + self._visualization_board[i][j]
-                    + " " * remaining_space)
-            print(st + "|")
+            # it also contains the vertical header. Cell contents come
+            # preformatted at full width from the _CELL lookup, so each
+            # cell is a tuple index instead of a format-and-pad.
+            lines.append(
+                row_labels[i] + "|"
+                + "|".join(_CELL[s + 1] for s in vis_state[i]) + "|")
 
             # Drawing the third line of each row.
-            st = " " * left_margin
-            for _ in range(self._board_size):
-                st = st + "|" + "_" * (cell_width - 1)
-            print(st + '|')
-        print()
+            lines.append(under_line)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
     def play(self, x: int, y: int):
@@ -223,8 +302,7 @@ class MineSweeper:
             print("You lost the game.")
             return
 
-        total_cells = self._board_size * self._board_size
-        if self._seen_cells == total_cells - self._number_of_mines:
+        if self._seen_cells == self._cells_to_win:
             self._game_over = True
             print("You won!")
 
@@ -236,31 +314,23 @@ class MineSweeper:
 
 if __name__ == "__main__":
     print("Enter square board size and number of mines, eg \"10 20\":")
-    user_inputs = input()
-    indices = user_inputs.split()
-    # Need to check that board_size is positive number
-    # and number of mines is non-negative.
-    # Also need to check that board is bigger than the number of mines.
-    while ((not len(indices) == 2)
-           or (not indices[0].isdigit())
-           or (not indices[1].isdigit())
-           or int(indices[0]) <= 0
-           or int(indices[1]) < 0
-           or int(indices[0]) * int(indices[0]) < int(indices[1])):
+    # The regex guarantees two non-negative integers in one match, so
+    # only the relation between them still needs checking: board_size
+    # must be positive and the board bigger than the number of mines.
+    match = _INPUT_RE.match(input())
+    while (match is None
+           or int(match.group(1)) <= 0
+           or (int(match.group(1)) * int(match.group(1))
+               < int(match.group(2)))):
         print("Please enter valid board size and number of mines.")
-        user_inputs = input()
-        indices = user_inputs.split()
+        match = _INPUT_RE.match(input())
 
-    m_sweeper = MineSweeper(int(indices[0]), int(indices[1]))
+    m_sweeper = MineSweeper(int(match.group(1)), int(match.group(2)))
     while not m_sweeper.game_over:
         print("Enter x and y, separated by space, eg \"1 3\":")
-        user_inputs = input()
-        indices = user_inputs.split()
-        if not len(indices) == 2:
-            print("Please enter two indices, separated by space.")
-            continue
-        if (not indices[0].isdigit()) or (not indices[1].isdigit()):
-            print("Please enter valid indices.")
+        match = _INPUT_RE.match(input())
+        if match is None:
+            print("Please enter two valid indices, separated by space.")
             continue
-        m_sweeper.play(int(indices[0]), int(indices[1]))
+        m_sweeper.play(int(match.group(1)), int(match.group(2)))
 